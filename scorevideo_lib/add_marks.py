@@ -5,7 +5,7 @@
 
 """
 
-from typing import List, Tuple
+from typing import Iterable, List, Pattern, Tuple, Union
 import re
 from datetime import timedelta
 from scorevideo_lib.parse_log import RawLog, Log, Mark, BehaviorFull
@@ -13,10 +13,11 @@ from scorevideo_lib.parse_log import RawLog, Log, Mark, BehaviorFull
 
 START_MARK = "video start"
 END_MARK = "video end"
+ONE_MICROSECOND = timedelta(microseconds=1)
 
 
-def copy_mark_disjoint(logs: List[Log], src_pattern: str, dest: RawLog,
-                       dest_label: str) -> RawLog:
+def copy_mark_disjoint(logs: List[Log], src_pattern: Union[str, Pattern],
+                       dest: RawLog, dest_label: str) -> RawLog:
     """Copy a behavior into another log file as a mark, adjusting time and frame
 
     Time and frame are adjusted so as to be correct (potentially by being
@@ -29,7 +30,8 @@ def copy_mark_disjoint(logs: List[Log], src_pattern: str, dest: RawLog,
         logs: List of consecutive and non-overlapping logs to search for
             ``src_pattern`` in and account for when adjusting time and frame
         src_pattern: Search pattern (regular expression) that identifies the
-            behavior to copy
+            behavior to copy. May be pre-compiled with :py:func:`re.compile`
+            when copying many marks with the same pattern.
         dest: Log to insert mark into
         dest_label: Label for inserted mark
 
@@ -47,8 +49,9 @@ def copy_mark_disjoint(logs: List[Log], src_pattern: str, dest: RawLog,
     return copy_mark(log_tuples, src_pattern, dest, dest_label)
 
 
-def copy_mark(logs: List[Tuple[Log, timedelta, int]], src_pattern: str,
-              dest: RawLog, dest_label: str) -> RawLog:
+def copy_mark(logs: List[Tuple[Log, timedelta, int]],
+              src_pattern: Union[str, Pattern], dest: RawLog,
+              dest_label: str) -> RawLog:
     """Copy a behavior into another log file as a mark, adjusting time and frame
 
     Time and frame are adjusted so as to be correct (potentially by being
@@ -61,7 +64,8 @@ def copy_mark(logs: List[Tuple[Log, timedelta, int]], src_pattern: str,
             video (``dest`` for last video) starts, and frame at which the next
             video (``dest`` for last video) starts
         src_pattern: Search pattern (regular expression) that identifies the
-            behavior to copy
+            behavior to copy. The first matching behavior is used. May be
+            pre-compiled with :py:func:`re.compile`.
         dest: Log to insert mark into
         dest_label: Label for inserted mark
 
@@ -69,25 +73,24 @@ def copy_mark(logs: List[Tuple[Log, timedelta, int]], src_pattern: str,
         A copy of ``dest``, but with the new mark inserted
 
     """
-    found = False
+    pattern = re.compile(src_pattern)
     frames = 0
-    time = timedelta(seconds=0)
-    for tup in logs:
-        tup[0].sort_lists()
-
-    for log, s_time, s_frame in logs:
-        if not found:
-            for behav in log.full:
-                if re.match(src_pattern, behav.description):
-                    found = True
-
-                    frames = s_frame - behav.frame
-                    time = s_time - behav.time
-        else:
-            frames += s_frame
-            time += s_time
-
-    new_mark = Mark(-frames, -time, dest_label)
+    # Accumulate time as integer microseconds to avoid a timedelta per addition
+    time_us = 0
+
+    for i, (log, s_time, s_frame) in enumerate(logs):
+        log.sort_lists()
+        behav = next((behav for behav in log.full
+                      if pattern.match(behav.description)), None)
+        if behav is not None:
+            # Every later log only shifts the mark back by its full length
+            later = logs[i + 1:]
+            frames = s_frame - behav.frame + sum(frame for _, _, frame in later)
+            time_us = (s_time - behav.time) // ONE_MICROSECOND + \
+                sum(t // ONE_MICROSECOND for _, t, _ in later)
+            break
+
+    new_mark = Mark(-frames, -timedelta(microseconds=time_us), dest_label)
     new_log = RawLog.from_raw_log(dest)
     new_log.marks.append(new_mark.to_line_tab())
     return new_log
@@ -109,23 +112,26 @@ def get_ending_mark(marks: List[Mark]) -> Mark:
     for mark in marks:
         if mark.name == END_MARK:
             return mark
-    raise ValueError("No mark with name '{}' found in list '{}'".format(
-        END_MARK, marks))
+    raise ValueError("No mark with name '{}' found among marks named '{}'"
+                     .format(END_MARK, [mark.name for mark in marks]))
 
 
 def get_ending_behav(behavs: List[BehaviorFull],
-                     end_descriptions: List[str]) -> BehaviorFull:
+                     end_descriptions: Iterable[str]) -> BehaviorFull:
     """Get the behavior whose description is found in a list
 
     Args:
         behavs: List of behaviors whose descriptions to search through
-        end_descriptions: List of descriptions to search for
+        end_descriptions: Descriptions to search for
 
     Returns: The first behavior whose description is found in the list
 
     """
-    for behav in behavs:
-        if behav.description in end_descriptions:
-            return behav
+    if not isinstance(end_descriptions, (set, frozenset)):
+        end_descriptions = frozenset(end_descriptions)
+    behav = next((behav for behav in behavs
+                  if behav.description in end_descriptions), None)
+    if behav is not None:
+        return behav
     raise ValueError("No ending behavior description found in '{}'".format(
-        behavs))
+        [behav.description for behav in behavs]))
@@ -5,25 +5,69 @@
 
 """
 
-from typing import Callable, Iterable, List
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Tuple
+
+
+# Slot names of each class, filled in by _slot_names
+_SLOT_NAMES = {}  # type: Dict[type, Tuple[str, ...]]
+# Stands in for slots that have not been assigned
+_UNSET = object()
+
+
+def _slot_names(cls: type) -> Tuple[str, ...]:
+    """Get the names of the slots declared by a class and its superclasses
+
+    Args:
+        cls: The class whose slots to find
+
+    Returns: The slot names, starting with those of the most basic class
+
+    """
+    names = _SLOT_NAMES.get(cls)
+    if names is None:
+        slots = []  # type: List[str]
+        for klass in reversed(cls.__mro__):
+            slots.extend(klass.__dict__.get("__slots__", ()))
+        names = _SLOT_NAMES[cls] = tuple(slots)
+    return names
 
 
 class BaseOps:
     """Superclass for basic operations
 
+    Attributes may be stored in ``__slots__`` or in the instance dictionary.
+    Objects are equal when their attributes are equal and one is an instance
+    of the other's class.
+
     """
 
+    __slots__ = ()
+
+    def _attrs(self) -> Dict[str, Any]:
+        # pylint: disable=missing-docstring
+        attrs = {name: getattr(self, name)
+                 for name in _slot_names(type(self)) if hasattr(self, name)}
+        attrs.update(getattr(self, "__dict__", {}))
+        return attrs
+
     def __repr__(self):
         # pylint: disable=missing-docstring
-        return str(self.__dict__)
+        return str(self._attrs())
 
     def __str__(self):
         # pylint: disable=missing-docstring
-        return self.__repr__()
+        return repr(self)
 
     def __eq__(self, other):
         # pylint: disable=missing-docstring
-        return self.__repr__() == other.__repr__()
+        if not isinstance(other, type(self)):
+            return NotImplemented
+        # Compare values in place instead of building a dict of each object.
+        # other may be a subclass with more slots, so use its slot names.
+        for name in _slot_names(type(other)):
+            if getattr(self, name, _UNSET) != getattr(other, name, _UNSET):
+                return False
+        return getattr(self, "__dict__", {}) == getattr(other, "__dict__", {})
 
 
 def add_to_partition(elem: str, partitions: List[List[str]],
@@ -46,8 +90,9 @@ def add_to_partition(elem: str, partitions: List[List[str]],
     for partition in partitions:
         if is_equiv(elem, partition[0]):
             partition.append(elem)
-            return partitions
-    partitions.append([elem])
+            break
+    else:
+        partitions.append([elem])
     return partitions
 
 
@@ -65,6 +110,10 @@ def equiv_partition(lst: Iterable[str],
     Returns: A list of the partitions. Each element will be in exactly one
         partition.
 
+    This compares each element against a representative of every partition.
+    When equivalence means having the same key, use
+    :py:func:`equiv_partition_by_key` instead.
+
     """
     partitions = []  # type: List[List[str]]
     for elem in lst:
@@ -72,6 +121,32 @@ def equiv_partition(lst: Iterable[str],
     return partitions
 
 
+def equiv_partition_by_key(lst: Iterable[str], key: Callable[[str], Hashable]) \
+        -> List[List[str]]:
+    """Splits elements into equivalence classes of elements with equal keys
+
+    Produces the same partitions as :py:func:`equiv_partition` would with an
+    ``is_equiv`` of ``lambda x, y: key(x) == key(y)``, but calls ``key`` once
+    per element instead of comparing against every partition.
+
+    >>> equiv_partition_by_key(["a1", "b1", "a2"], lambda x: x[0])
+    [['a1', 'a2'], ['b1']]
+
+    Args:
+        lst: The elements to divide in to equivalence classes. Is not modified.
+        key: A function that accepts an element of lst and returns a hashable
+            key. Elements with equal keys are placed in the same partition.
+
+    Returns: A list of the partitions in order of first appearance. Each
+        element will be in exactly one partition.
+
+    """
+    partitions = {}  # type: Dict[Hashable, List[str]]
+    for elem in lst:
+        partitions.setdefault(key(elem), []).append(elem)
+    return list(partitions.values())
+
+
 def remove_trailing_newline(s: str):
     r"""Remove a single trailing newline if it exists in a string
 
@@ -89,6 +164,4 @@ def remove_trailing_newline(s: str):
 
     """
     # For how to include `\n` in doctests: https://stackoverflow.com/a/8849771
-    if s and s[-1] == "\n":
-        s = s[:-1]
-    return s
+    return s[:-1] if s.endswith("\n") else s
@@ -11,19 +11,21 @@ class FileFormatError(Exception):
     The message should describe the file and how it is mis-formatted.
     """
 
-    @staticmethod
-    def from_lines(filename, found_line, expected_line):
+    @classmethod
+    def from_lines(cls, filename, found_line, expected_line):
         """Create new object with message from parameters.
 
+        >>> str(FileFormatError.from_lines("a.txt", "foo", "bar"))
+        "In the file 'a.txt', the line 'foo' was found instead of the expected 'bar'."
+
         Args:
             filename: Name of file that is improperly formatted
             found_line: The line that was found in the file
             expected_line: The line that was expected to be found
 
-        Returns: None
+        Returns: The new exception object
 
         """
-        message = "In the file '" + filename + "', the line '" + \
-                  found_line + "' was found instead of the expected '" + \
-                  expected_line + "'."
-        return FileFormatError(message)
+        message = f"In the file '{filename}', the line '{found_line}' was " \
+                  f"found instead of the expected '{expected_line}'."
+        return cls(message)
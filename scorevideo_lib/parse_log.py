@@ -5,42 +5,52 @@
 
 """
 
-from typing import List, Optional
-import re
+from typing import List, Optional, Sequence
 from datetime import timedelta
-from datetime import datetime
-from functools import total_ordering
 from scorevideo_lib.exceptions import FileFormatError
-from scorevideo_lib.base_utils import BaseOps, remove_trailing_newline
+from scorevideo_lib.base_utils import BaseOps
+from scorevideo_lib.section_items import BehaviorFull, Mark, \
+    BEHAVIOR_SORT_KEY, MARK_SORT_KEY
+# Re-exported for code that imports it from this module
+from scorevideo_lib.section_items import \
+    SectionItem  # pylint: disable=unused-import
 
 
 LONG_LINE = "------------------------------------------"
 SHORT_LINE = "-------------------------------"
 VIDEO_INFO_START = "VIDEO FILE SET"
 COMMANDS_START = "COMMAND SET AND SETTINGS"
-COMMANDS_HEADER = ["-------------------------------",
+COMMANDS_HEADER = ("-------------------------------",
                    "start|stop|subject|description",
-                   "-------------------------------"]
+                   "-------------------------------")
 # TODO: This is hacky and not generic
-POST_COMMANDS_TEXT = ["subject 1:  subject1",
+POST_COMMANDS_TEXT = ("subject 1:  subject1",
                       "subject 2:  subject2",
                       "subj#:  0=either  1=subject1  2=subject2  3=both",
-                      "No. of simultaneous behaviors:  one"]
+                      "No. of simultaneous behaviors:  one")
 RAW_START = "RAW LOG"
-RAW_HEADER = [LONG_LINE,
+RAW_HEADER = (LONG_LINE,
               "frame|time(min:sec)|command",
-              LONG_LINE]
+              LONG_LINE)
 FULL_START = "FULL LOG"
-FULL_HEADER = [LONG_LINE,
+FULL_HEADER = (LONG_LINE,
                "frame|time(min:sec)|description|action|subject",
-               LONG_LINE]
+               LONG_LINE)
 NOTES_START = "NOTES"
-NOTES_HEADER = [LONG_LINE]
-MARKS_HEADER = [LONG_LINE,
+NOTES_HEADER = (LONG_LINE,)
+MARKS_HEADER = (LONG_LINE,
                 "frame|time(min:sec)|mark name",
-                LONG_LINE]
+                LONG_LINE)
 MARKS_START = "MARKS"
 EMPTY_STR_LIST = []  # type: List[str]
+# The sections after the header, in file order, as
+# (attribute, start line, header lines, end line)
+SECTIONS = (("video_info", VIDEO_INFO_START, (), ""),
+            ("commands", COMMANDS_START, COMMANDS_HEADER, SHORT_LINE),
+            ("raw", RAW_START, RAW_HEADER, LONG_LINE),
+            ("full", FULL_START, FULL_HEADER, LONG_LINE),
+            ("notes", NOTES_START, NOTES_HEADER, LONG_LINE),
+            ("marks", MARKS_START, MARKS_HEADER, LONG_LINE))
 
 
 class Log(BaseOps):
@@ -57,6 +67,9 @@ class Log(BaseOps):
             the log file
 
     """
+
+    __slots__ = ("full", "marks")
+
     def __init__(self) -> None:
         """Initialize instance attributes as ``None``
 
@@ -107,8 +120,8 @@ class Log(BaseOps):
         """
         new_log = Log()
 
-        new_log.full = [BehaviorFull(line) for line in log.full]
-        new_log.marks = [Mark.from_line(line) for line in log.marks]
+        new_log.full = list(map(BehaviorFull, log.full))
+        new_log.marks = list(map(Mark.from_line, log.marks))
 
         return new_log
 
@@ -133,8 +146,9 @@ class Log(BaseOps):
             None
 
         """
-        self.marks.sort()
-        self.full.sort()
+        # Comparing key tuples in C is much faster than calling __lt__
+        self.marks.sort(key=MARK_SORT_KEY)
+        self.full.sort(key=BEHAVIOR_SORT_KEY)
 
     def extend(self, log: "Log") -> None:
         """Add each element of each section of a log to the current log.
@@ -150,6 +164,107 @@ class Log(BaseOps):
         self.full.extend(log.full)
 
 
+class _LineCursor:
+    """A position in the lines of a log file that has been read into memory
+
+    Reading the whole file at once and walking an index through the lines is
+    much faster than reading and stripping the file one line at a time. As
+    with :py:meth:`io.TextIOBase.readline`, the end of the file reads as an
+    empty line.
+
+    Attributes:
+        lines: The lines of the file, without line endings
+        pos: The index in ``lines`` of the next line to read
+        name: The name of the file, for use in error messages
+    """
+
+    def __init__(self, lines: List[str], name: str) -> None:
+        self.lines = lines
+        self.pos = 0
+        self.name = name
+
+    @classmethod
+    def read_all(cls, log_file) -> "_LineCursor":
+        """Get a cursor over the rest of a file
+
+        Lines are split only on newlines, not on the other separators
+        recognized by :py:meth:`str.splitlines`.
+
+        >>> import io
+        >>> _LineCursor.read_all(io.StringIO("a\\x0cb\\r\\nc")).lines
+        ['a\\x0cb', 'c', '']
+
+        Args:
+            log_file: An open file object, read from its current position to
+                the end
+
+        Returns:
+            A cursor positioned at the first unread line of ``log_file``
+
+        """
+        lines = log_file.read().replace("\r\n", "\n").split("\n")
+        # A file that ends in a newline already ends with an empty line
+        if lines[-1]:
+            lines.append("")
+        return cls(lines, getattr(log_file, "name", repr(log_file)))
+
+    @classmethod
+    def read_section(cls, log_file, start: str, header_len: int,
+                     end: str) -> "_LineCursor":
+        """Get a cursor over a file's lines through the end of a section
+
+        The file is read only through the ``end`` line of the section, so it is
+        left ready to read the next section. See :py:meth:`RawLog.get_section`.
+
+        Args:
+            log_file: An open file object, read from its current position
+            start: Line that signals the start of the section
+            header_len: Number of header lines that follow ``start``
+            end: Line that signals the end of the section
+
+        Returns:
+            A cursor over the lines read, positioned at the first of them
+
+        """
+        lines = []  # type: List[str]
+        # Look up the methods once rather than on every line
+        readline = log_file.readline
+        append = lines.append
+        # 0: before the start line, 1: in the header, 2: in the body
+        phase = 0
+        remaining = header_len
+        while True:
+            line = readline()
+            if not line:
+                append("")
+                break
+            # Files opened in text mode translate line endings to "\n", but
+            # io.StringIO and newline="" handles keep any "\r"
+            line = line.rstrip("\r\n")
+            append(line)
+            if phase == 0:
+                if line == start:
+                    phase = 1 if header_len else 2
+            elif phase == 1:
+                remaining -= 1
+                if remaining == 0:
+                    phase = 2
+            elif line == end:
+                break
+        return cls(lines, getattr(log_file, "name", repr(log_file)))
+
+    def next_line(self) -> str:
+        """Read the next line, or ``""`` past the end of the file
+
+        Returns:
+            The line at :py:attr:`pos`, which is then advanced
+
+        """
+        line = self.lines[self.pos] if self.pos < len(self.lines) else ""
+        self.pos += 1
+        return line
+
+
 class RawLog(BaseOps):
     """Store an interpreted form of a log file and perform operations on it
 
@@ -166,6 +281,9 @@ class RawLog(BaseOps):
     # pylint: disable=too-many-instance-attributes
     # In this case, it is reasonable to have an instance attribute per section
 
+    __slots__ = ("header", "video_info", "commands", "raw", "full", "notes",
+                 "marks")
+
     def __init__(self) -> None:
         self.header = []  # type: List[str]
         self.video_info = []  # type: List[str]
@@ -179,22 +297,22 @@ class RawLog(BaseOps):
     def from_file(cls, log_file) -> "RawLog":
         """Parse log file into its sections.
 
-        Populate the attributes of the RawLog class by using the get_section_*
-        static methods to extract sections that are stored in attributes.
+        Populate the attributes of the RawLog class by extracting each section
+        in :py:data:`SECTIONS` with :py:meth:`RawLog.get_section`. Since the
+        sections are found in file order from a shared position, each line is
+        examined only once.
 
         Args:
             log_file: An open file object that points to the log file to read.
         """
 
         log = RawLog()
+        # Read the file once and share the position between sections
+        cursor = _LineCursor.read_all(log_file)
 
-        log.header = RawLog.get_section_header(log_file)
-        log.video_info = RawLog.get_section_video_info(log_file)
-        log.commands = RawLog.get_section_commands(log_file)
-        log.raw = RawLog.get_section_raw(log_file)
-        log.full = RawLog.get_section_full(log_file)
-        log.notes = RawLog.get_section_notes(log_file)
-        log.marks = RawLog.get_section_marks(log_file)
+        log.header = RawLog.get_section_header(cursor)
+        for attr, start, header, end in SECTIONS:
+            setattr(log, attr, RawLog.get_section(cursor, start, header, end))
         log_file.seek(0)
 
         return log
@@ -240,10 +358,9 @@ class RawLog(BaseOps):
             each line a separate element in the list.
             Newlines or return carriages are stripped from the ends of lines.
         """
-        header = []
-        for _ in range(2):
-            header.append(log_file.readline().rstrip())
-        return header
+        if isinstance(log_file, _LineCursor):
+            return [log_file.next_line().rstrip() for _ in range(2)]
+        return [log_file.readline().rstrip() for _ in range(2)]
 
     @staticmethod
     def get_section_video_info(log_file) -> List[str]:
@@ -264,7 +381,7 @@ class RawLog(BaseOps):
             each line a separate element in the list.
             Newlines or return carriages are stripped from the ends of lines.
         """
-        return RawLog.get_section(log_file, VIDEO_INFO_START, [], "")
+        return RawLog.get_section(log_file, VIDEO_INFO_START, (), "")
 
     @staticmethod
     def get_section_commands(log_file) -> List[str]:
@@ -284,10 +401,8 @@ class RawLog(BaseOps):
             each line a separate element in the list.
             Newlines or return carriages are stripped from the ends of lines.
         """
-        header = COMMANDS_HEADER
-        end = SHORT_LINE
-        return RawLog.get_section(log_file, COMMANDS_START, header,
-                                  end)
+        return RawLog.get_section(log_file, COMMANDS_START, COMMANDS_HEADER,
+                                  SHORT_LINE)
 
     @staticmethod
     def get_section_raw(log_file) -> List[str]:
@@ -307,9 +422,7 @@ class RawLog(BaseOps):
             each line a separate element in the list.
             Newlines or return carriages are stripped from the ends of lines.
         """
-        header = RAW_HEADER
-        end = LONG_LINE
-        return RawLog.get_section(log_file, RAW_START, header, end)
+        return RawLog.get_section(log_file, RAW_START, RAW_HEADER, LONG_LINE)
 
     @staticmethod
     def get_section_full(log_file) -> List[str]:
@@ -329,9 +442,7 @@ class RawLog(BaseOps):
             each line a separate element in the list.
             Newlines or return carriages are stripped from the ends of lines.
         """
-        header = FULL_HEADER
-        end = LONG_LINE
-        return RawLog.get_section(log_file, FULL_START, header, end)
+        return RawLog.get_section(log_file, FULL_START, FULL_HEADER, LONG_LINE)
 
     @staticmethod
     def get_section_notes(log_file) -> List[str]:
@@ -350,9 +461,8 @@ class RawLog(BaseOps):
             each line a separate element in the list.
             Newlines or return carriages are stripped from the ends of lines.
         """
-        header = NOTES_HEADER
-        end = LONG_LINE
-        return RawLog.get_section(log_file, NOTES_START, header, end)
+        return RawLog.get_section(log_file, NOTES_START, NOTES_HEADER,
+                                  LONG_LINE)
 
     @staticmethod
     def get_section_marks(log_file) -> List[str]:
@@ -372,12 +482,11 @@ class RawLog(BaseOps):
             each line a separate element in the list.
             Newlines or return carriages are stripped from the ends of lines.
         """
-        header = MARKS_HEADER
-        end = LONG_LINE
-        return RawLog.get_section(log_file, MARKS_START, header, end)
+        return RawLog.get_section(log_file, MARKS_START, MARKS_HEADER,
+                                  LONG_LINE)
 
     @staticmethod
-    def get_section(log_file, start: str, header: List[str], end: str) \
+    def get_section(log_file, start: str, header: Sequence[str], end: str) \
             -> List[str]:
         """Get an arbitrary section from a log file.
 
@@ -393,10 +502,12 @@ class RawLog(BaseOps):
         Args:
             log_file: An open file object that points to the log file to read.
                 The file object must be ready to be read,
-                and it should be at the start of the file.
+                and it should be at the start of the file. The file is read
+                only through the end of the section, so the next section can
+                be extracted with another call.
             start: Line that signals the start of the section
-            header: List of lines that form a header to the section. If no
-                header should be present, pass an empty list.
+            header: Lines that form a header to the section. If no header
+                should be present, pass an empty sequence.
             end: Line that signals the end of the section
 
         Returns:
@@ -404,34 +515,44 @@ class RawLog(BaseOps):
             each line a separate element in the list.
             Newlines or return carriages are stripped from the ends of lines.
         """
-        line = log_file.readline()
-        while remove_trailing_newline(line) != start:
-            # readline returns '' at the end of a file and '\n' for blank lines
-            if line == "":
-                raise FileFormatError("The start line '" + start +
-                                      "' was not found in " + log_file.name)
-            else:
-                line = log_file.readline()
-        for header_line in header:
-            found_line = remove_trailing_newline(log_file.readline())
-            if header_line != found_line:
-                raise FileFormatError.from_lines(log_file.name, found_line,
-                                                 header_line)
-        section = []
-        line = log_file.readline()
-        while not remove_trailing_newline(line) == end:
-            if line == "":
-                raise FileFormatError("The end line '" + end +
-                                      "' was not found in " + log_file.name)
-            section.append(remove_trailing_newline(line))
-            line = log_file.readline()
-
-        return section
+        if isinstance(log_file, _LineCursor):
+            cursor = log_file
+        else:
+            cursor = _LineCursor.read_section(log_file, start, len(header),
+                                              end)
+        lines = cursor.lines
+        n_lines = len(lines)
+        n_header = len(header)
+
+        try:
+            pos = lines.index(start, cursor.pos) + 1
+        except ValueError:
+            raise FileFormatError(f"The start line '{start}' was not found "
+                                  f"in {cursor.name}") from None
+
+        if tuple(lines[pos:pos + n_header]) != tuple(header):
+            # Only walk the header line by line to report the first mismatch
+            for i, header_line in enumerate(header):
+                # Past the end of the file, act as if an empty line were found
+                found_line = lines[pos + i] if pos + i < n_lines else ""
+                if header_line != found_line:
+                    raise FileFormatError.from_lines(cursor.name, found_line,
+                                                     header_line)
+        pos += n_header
+
+        try:
+            end_pos = lines.index(end, pos)
+        except ValueError:
+            raise FileFormatError(f"The end line '{end}' was not found "
+                                  f"in {cursor.name}") from None
+        cursor.pos = end_pos + 1
+
+        return lines[pos:end_pos]
 
     @staticmethod
-    def section_to_strings(start: str, header: List[str], body: List[str],
-                           end: Optional[str],
-                           trailing: List[str] = None) -> List[str]:
+    def section_to_strings(start: str, header: Sequence[str],
+                           body: List[str], end: Optional[str],
+                           trailing: Sequence[str] = None) -> List[str]:
         """Combine a section's components into a list of strings for writing
 
         Args:
@@ -490,470 +611,3 @@ class RawLog(BaseOps):
 
         """
         return str(self.to_lines())
-
-
-class SectionItem(BaseOps):
-    """Superclass for entries in a section of a log
-
-    """
-
-    @staticmethod
-    def validate_frame(frame: str) -> bool:
-        """Check whether ``frame`` represents a valid frame number
-
-        A valid frame number is any integer. Specifically, any ``frame`` that is
-        composed solely of one or more digits 0-9 is accepted. Negative frames
-        are allowed and denoted by a prefix of ``-``.
-
-        >>> SectionItem.validate_frame("-5")
-        True
-        >>> SectionItem.validate_frame("05")
-        True
-        >>> SectionItem.validate_frame("hi5")
-        False
-        >>> SectionItem.validate_frame("50")
-        True
-        >>> SectionItem.validate_frame(" 50 ")
-        False
-
-        Args:
-            frame: Potential frame number to validate
-
-        Returns: ``True`` if ``frame`` is a valid frame number, ``False``
-            otherwise
-
-        """
-        if frame[0] == "-":
-            frame = frame[1:]
-
-        return re.fullmatch(r"\A[0-9]+\Z", frame) is not None
-
-    @staticmethod
-    def validate_time(time_str: str) -> bool:
-        """Check whether ``time_str`` represents a valid log time stamp
-
-        The following formats are accepted where ``#`` represents a digit 0-9
-        * ``#:##.##``
-        * ``##:##.##``
-        * ``#:##:##.##``
-        * ``##:##:##.##``
-
-        A prefix of ``-`` is also allowed.
-
-        TODO: Check whether the minute and hour values are valid (i.e. <60)
-
-        Args:
-            time_str: The potential time representation to validate
-
-        Returns: ``True`` if ``time_str`` is a valid time, ``False`` otherwise
-
-        """
-        num_colons = time_str.count(":")
-
-        if time_str[0] == "-":
-            time_str = time_str[1:]
-
-        if num_colons == 1:
-            return re.fullmatch(r"\A[0-9]{1,2}:[0-9]{2}\.[0-9]{2}\Z",
-                                time_str) is not None
-        if num_colons == 2:
-            return re.fullmatch(r"\A[0-9]{1,2}:[0-9]{2}:[0-9]{2}\.[0-9]{2}\Z",
-                                time_str) is not None
-
-        return False
-
-    @staticmethod
-    def validate_description(desc: str) -> bool:
-        """Check whether ``desc`` is a valid behavior description
-
-        To be valid, ``desc`` must be made exclusively of digits, letters,
-        commas, and spaces.
-
-        >>> SectionItem.validate_description("Some Description 3!")
-        False
-        >>> SectionItem.validate_description("Some Description, 3")
-        True
-        >>> SectionItem.validate_description("Some Description 3")
-        True
-        >>> SectionItem.validate_description("Some Description 3 here")
-        True
-        >>> SectionItem.validate_description("Some \\n Description 3!")
-        False
-
-        Args:
-            desc: The potential behavior description to check
-
-        Returns: ``True`` if ``desc`` is valid, ``False`` otherwise
-
-        """
-        return re.fullmatch(r"\A[0-9A-Za-z ,]+\Z", desc) is not None
-
-    @staticmethod
-    def split_line(line: str) -> List[str]:
-        """Split a RawLog file line in a section into its elements
-
-        Elements must be separated by at least two spaces
-
-        >>> SectionItem.split_line("  hi  4  test   >?why    my4 j   ")
-        ['hi', '4', 'test', '>?why', 'my4 j']
-
-        Args:
-            line: Line to split
-
-        Returns: A list of the elements in the provided line
-
-        """
-        split = re.split(r"\s{2,}", line)
-        split[0] = split[0].lstrip()
-        split[-1] = split[-1].rstrip()
-        return [elem for elem in split if elem != ""]
-
-    @staticmethod
-    def str_to_timedelta(time_str: str) -> timedelta:
-        """Convert a string representation of a time into a :py:class:timedelta
-
-        >>> SectionItem.str_to_timedelta("30:00.03")
-        datetime.timedelta(seconds=1800, microseconds=30000)
-
-        Args:
-            time_str: String representation of the time or duration
-
-        Returns: :py:class:timedelta object that represents the same duration
-            or time as ``time_str`` does.
-
-        """
-        neg = False
-
-        if time_str[0] == "-":
-            neg = True
-            time_str = time_str[1:]
-
-        split_time = time_str.split(":")
-        secs = float(split_time[-1])
-        # MM:SS.SS -> [MM, SS.SS]
-        if len(split_time) == 2:
-            secs += int(split_time[0]) * 60
-        # HH:MM:SS.SS -> [HH, MM, SS.SS]
-        elif len(split_time) == 3:
-            secs += int(split_time[0]) * 60 * 60
-            secs += int(split_time[1]) * 60
-        if neg:
-            secs = -secs
-        return timedelta(seconds=secs)
-
-
-@total_ordering
-class BehaviorFull(SectionItem):
-    """Store an interpreted representation of a behavior from the full section
-
-    Attributes:
-        frame: A positive integer representing the frame number on which the
-            behavior was scored.
-        time: A :py:class:timedelta object that represents the time elapsed
-            from the start of the clip to the behavior being scored. This is a
-            representation of the time listed in the log line.
-        description: The name of the behavior that appears as the second-to-last
-            element in the provided line
-        subject: Always the string ``either``
-        startend: Optional, either ``start`` or ``end``
-    """
-
-    def __init__(self, behavior_line: str) -> None:
-        """Create a new :py:class:`BehaviorFull` object from the provided line.
-
-        >>> behav = BehaviorFull(" 1769  0:58.97  Flee from male  either ")
-        >>> behav.frame
-        1769
-        >>> behav.time
-        datetime.timedelta(seconds=58, microseconds=970000)
-        >>> behav.description
-        'Flee from male'
-        >>> behav.subject
-        'either'
-        >>> print(behav.startend)
-        None
-
-        Args:
-            behavior_line: A line from the ``FULL LOG`` section of a log file
-        Returns:
-            None
-        Raises:
-            TypeError: When the provided line does not conform to the
-                expected format. Notably, all the elements of the line must be
-                separated from each other by at least 2 spaces.
-        """
-        line = SectionItem.split_line(behavior_line)
-        line_error = "The line '" + behavior_line + "' is not a valid line " \
-                                                    "from the FULL LOG section"
-        if len(line) > 5:
-            err = "{} (num elements: {} > 5)".format(line_error, len(line))
-            raise TypeError(err)
-        elif len(line) < 4:
-            err = "{} (num elements: {} < 4)".format(line_error, len(line))
-            raise TypeError(err)
-        elif not SectionItem.validate_frame(line[0]):
-            err = "{} ('{}' is not a valid frame number)".format(line_error,
-                                                                 line[0])
-            raise TypeError(err)
-        elif not SectionItem.validate_time(line[1]):
-            err = "{} ('{}' is not a valid time)".format(line_error, line[1])
-            raise TypeError(err)
-        elif not SectionItem.validate_description(line[2]):
-            err = "{} ('{}' is not a valid behavior)".format(line_error,
-                                                             line[2])
-            raise TypeError(err)
-        elif not BehaviorFull.validate_subject(line[3]):
-            err = "{} ('{}' is not a valid subject)".format(line_error, line[3])
-            raise TypeError(err)
-
-        self.frame = int(line[0])
-        self.time = SectionItem.str_to_timedelta(line[1])
-        self.description = line[2]
-        self.subject = line[3]
-        self.startend = line[4] if len(line) == 5 else None
-
-    @staticmethod
-    def validate_subject(subject: str) -> bool:
-        """Check whether ``subject`` is a valid subject element
-
-        To be valid, ``subject`` must be exactly ``either``
-
-        >>> BehaviorFull.validate_subject("either")
-        True
-        >>> BehaviorFull.validate_subject(" either")
-        False
-
-        Args:
-            subject: Potential subject element of a log to check
-
-        Returns: ``True`` if ``subject`` is valid, ``False`` otherwise
-
-        """
-        return subject == "either"
-
-    def __lt__(self, other: "BehaviorFull"):
-        if self.frame != other.frame:
-            return self.frame < other.frame
-        if self.time != other.time:
-            return self.time < other.time
-        if self.description != other.description:
-            return self.description < other.description
-        if self.subject != other.subject:
-            return self.subject < other.subject
-        return False
-
-
-@total_ordering
-class Mark(SectionItem):
-    """Store a ``mark`` from the ``MARKS`` section
-
-    Attributes:
-        frame: An integer representing the frame number at which the
-            mark is placed
-        time: A :py:class:timedelta object that represents the time elapsed
-            from the start of the clip to the mark. This is a
-            representation of the time listed in the log line. Negative times
-            are supported and are represented as their absolute times prefixed
-            with a ``-``.
-        name: Name of the mark that describes its meaning
-    """
-
-    def __init__(self, frame: int, time: timedelta, name: str) -> None:
-        self.frame = frame
-        self.time = time
-        self.name = name
-
-    @classmethod
-    def from_line(cls, line: str) -> "Mark":
-        """Create a new :py:class:Mark from a provided line from the log file
-
-        >>> mark = Mark.from_line("54001    30:00.03    video end")
-        >>> mark.frame
-        54001
-        >>> mark.time
-        datetime.timedelta(seconds=1800, microseconds=30000)
-        >>> mark.name
-        'video end'
-
-        Args:
-            line: A line from the ``MARKS`` section of a log file
-        Returns:
-            None
-        Raises:
-            TypeError: When the provided line does not conform to the
-                expected format. Notably, all 3 elements of the line must be
-                separated from each other by at least 2 spaces.
-
-        """
-        elems = SectionItem.split_line(line)
-        line_error = "The line '{}' is not a valid line from the MARKS section"\
-            .format(line)
-        if len(elems) < 3:
-            err = "{} (num elements: {} < 3)".format(line_error, len(elems))
-            raise TypeError(err)
-        elif len(elems) > 3:
-            err = "{} (num elements: {} > 3)".format(line_error, len(elems))
-            raise TypeError(err)
-        elif not SectionItem.validate_frame(elems[0]):
-            err = "{} (frame '{}' is not valid)".format(line_error, elems[0])
-            raise TypeError(err)
-        elif not SectionItem.validate_time(elems[1]):
-            err = "{} (time '{}' is not valid)".format(line_error, elems[1])
-            raise TypeError(err)
-        elif not SectionItem.validate_description(elems[2]):
-            err = "{} (mark name '{}' is invalid)".format(line_error, elems[2])
-            raise TypeError(err)
-
-        frame = int(elems[0])
-        time = SectionItem.str_to_timedelta(elems[1])
-        name = elems[2]
-
-        return cls(frame, time, name)
-
-    @staticmethod
-    def time_to_str(time: timedelta) -> str:
-        """Converts a :py:class:`timedelta` object into a string
-
-        >>> Mark.time_to_str(timedelta(seconds=1800.07))
-        '30:00.07'
-        >>> Mark.time_to_str(timedelta(seconds=4.4557))
-        '0:04.45'
-        >>> Mark.time_to_str(timedelta(seconds=3600.5))
-        '1:00:00.50'
-        >>> Mark.time_to_str(timedelta(seconds=-1800.07))
-        '-30:00.07'
-
-        Args:
-            time: The time to turn into a string.
-
-        Returns:
-            A string representation of the time, with 2 decimal-places of second
-            precision. The result is truncated if necessary.
-
-        Raises:
-            ValueError: Raised if time is greater than 1 day.
-        """
-        secs = datetime.utcfromtimestamp(abs(time.total_seconds()))
-        if abs(time) < timedelta(seconds=60):
-            # Under 1 minute (all can be expressed in secs microsecs)
-            time_str = "0:" + secs.strftime("%S.%f")
-        elif abs(time) < timedelta(seconds=60 * 60):
-            # Under 1 hour (all can be expressed in mins, secs, microsecs)
-            time_str = secs.strftime("%M:%S.%f")
-            if time_str[0] == "0":
-                time_str = time_str[1:]
-        elif abs(time) < timedelta(days=1):
-            # Under 1 day (all can be expressed in hrs, mins, secs, microsecs)
-            time_str = secs.strftime("%H:%M:%S.%f")
-            if time_str[0] == "0":
-                time_str = time_str[1:]
-        else:
-            raise ValueError("The duration '{}' is too long (must be < 1 day)"
-                             .format(str(time)))
-
-        # Truncate time_str to cut off all but 2 most significant decimal places
-        time_str = time_str[:time_str.index(".") + 3]
-
-        # Add negative sign for negative times
-        if time.total_seconds() < 0:
-            time_str = "-" + time_str
-
-        return time_str
-
-    def to_line(self, other_line: str) -> str:
-        """Converts a :py:class:Mark object into a log line in the MARKS section
-
-        ``other_line`` is used as a template. It should come from the log file
-        the returned line will be inserted into. Only loose error checking is
-        performed, and invalid lines may produce undefined output. Similarly,
-        if the constructed line cannot fit into the format prescribed by
-        ``other_line``, the output is undefined.
-
-        >>> mark = Mark(734, timedelta(seconds=1800.07), "video end")
-        >>> mark.to_line("  1    0:00.03    video start")
-        '734   30:00.07    video end'
-
-        Args:
-            other_line: A line from the MARKS section into which the resulting
-                string could be inserted. This defines the format this method
-                will attempt to match.
-
-        Returns: A log line that could be inserted into the MARKS section of
-            the log from which ``other_line`` came.
-
-        Raises:
-            ValueError: Raised if ``other_line`` is invalid or the mark's time
-                is greater than 1 day
-        """
-        match = re.search(r"\A(\s*\S+)(\s{2,}\S+)(\s{2,})(?:\S+\s*)+",
-                          other_line)
-        if match is None:
-            err = "other_line '{}' is not a valid line from the MARKS section".\
-                format(other_line)
-            raise ValueError(err)
-        # match.group(n) returns the string in other_line that was matched by
-        # the n-th parenthesized group in the regular expression. Note that
-        # `(?: ... )` does not count as a group in this context
-        frame_col_width = len(match.group(1))
-        time_col_width = len(match[2])
-        time_name_sep_width = len(match[3])
-
-        time_str = Mark.time_to_str(self.time)
-
-        # Creates a template like "{0:>frame_col_width}{1:>time_col_width}  {2}"
-        # Both the frame and time columns are right-justified and of lengths
-        # fixed by the variables frame_col_width and time_col_width. 0, 1, and 2
-        # are indices that define the locations to fill each arg of .format(...)
-        template = "{0:>" + str(frame_col_width) + "}{1:>" + \
-                   str(time_col_width) + "}" + (" " * time_name_sep_width) + \
-                   "{2}"
-        return template.format(self.frame, time_str, self.name)
-
-    def to_line_tab(self) -> str:
-        """Converts a :py:class:Mark object into a log line in the MARKS section
-
-        The resulting line is delimited by 4 spaces.
-
-        >>> mark = Mark(734, timedelta(seconds=1800.07), "video end")
-        >>> mark.to_line_tab()
-        '734    30:00.07    video end'
-
-        Returns:
-            A log line that could be inserted into the MARKS section of
-            the log from which ``other_line`` came. Note that since the line
-            has a fixed delimiter, this line may not appear to match the columns
-            in the file. However, this delimitation
-            is assumed by some other programs
-            for ``scorevideo`` logs, including ``behaviorcode``.
-
-        Raises:
-            ValueError: Raised if ``other_line`` is invalid or the mark's time
-                is greater than 1 day
-        """
-        time_str = Mark.time_to_str(self.time)
-        delim = '    '
-        return f"{self.frame}{delim}{time_str}{delim}{self.name}"
-
-    def __lt__(self, other: "Mark"):
-        """Determine if one :py:class:`Mark` is less than another
-
-        Ordering is performed with the ``<`` operator on the class's attributes
-        in the following descending order of priority:
-        * :py:attr:`Mark.frame`
-        * :py:attr:`Mark.time`
-        * :py:attr:`Mark.name`
-
-        Args:
-            other: The :py:class:`Mark` to compare to ``self``
-
-        Returns:
-            ``True`` if and only if ``self`` comes before ``other``
-
-        """
-        if self.frame != other.frame:
-            return self.frame < other.frame
-        if self.time != other.time:
-            return self.time < other.time
-        if self.name != other.name:
-            return self.name < other.name
-        return False
@@ -0,0 +1,604 @@
+# This file is part of scorevideo_lib: A library for working with scorevideo
+# Use of this file is governed by the license in LICENSE.txt.
+
+"""Parse the entries in the sections of log files
+
+"""
+
+from typing import Callable, List, Optional
+import re
+import string
+import sys
+from abc import ABCMeta, abstractmethod
+from datetime import timedelta
+from functools import lru_cache
+from operator import attrgetter
+from scorevideo_lib.base_utils import BaseOps
+
+
+# Allowed characters and patterns for the elements of section lines
+DESCRIPTION_CHARS = frozenset(string.ascii_letters + string.digits + " ,")
+ELEM_SEP_RE = re.compile(r"\s{2,}")
+MARK_LINE_RE = re.compile(r"(\s*\S+)(\s{2,}\S+)(\s{2,})(?:\S+\s*)+")
+# Sort keys that define the ordering of section items
+BEHAVIOR_SORT_KEY = attrgetter("frame", "time", "description", "subject")
+MARK_SORT_KEY = attrgetter("frame", "time", "name")
+
+
+class SectionItem(BaseOps, metaclass=ABCMeta):
+    """Abstract superclass for entries in a section of a log
+
+    Items are ordered by comparing the tuples returned by the subclass's
+    ``_sort_key`` method. Each comparison is a single tuple comparison in C.
+    Like equality, ordering accepts instances of the same class or of a
+    subclass.
+
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def _sort_key(self) -> tuple:
+        """Get the tuple that determines this item's position in a sort
+
+        Returns:
+            The values to compare, in descending order of priority
+
+        """
+
+    def __lt__(self, other):
+        # pylint: disable=missing-docstring
+        if not isinstance(other, type(self)):
+            return NotImplemented
+        return self._sort_key() < other._sort_key()
+
+    def __le__(self, other):
+        # pylint: disable=missing-docstring
+        if not isinstance(other, type(self)):
+            return NotImplemented
+        return self._sort_key() <= other._sort_key()
+
+    def __gt__(self, other):
+        # pylint: disable=missing-docstring
+        if not isinstance(other, type(self)):
+            return NotImplemented
+        return self._sort_key() > other._sort_key()
+
+    def __ge__(self, other):
+        # pylint: disable=missing-docstring
+        if not isinstance(other, type(self)):
+            return NotImplemented
+        return self._sort_key() >= other._sort_key()
+
+    @staticmethod
+    def validate_frame(frame: str) -> bool:
+        """Check whether ``frame`` represents a valid frame number
+
+        A valid frame number is any integer. Specifically, any ``frame`` that is
+        composed solely of one or more digits 0-9 is accepted. Negative frames
+        are allowed and denoted by a prefix of ``-``.
+
+        >>> SectionItem.validate_frame("-5")
+        True
+        >>> SectionItem.validate_frame("05")
+        True
+        >>> SectionItem.validate_frame("hi5")
+        False
+        >>> SectionItem.validate_frame("50")
+        True
+        >>> SectionItem.validate_frame(" 50 ")
+        False
+
+        Args:
+            frame: Potential frame number to validate
+
+        Returns: ``True`` if ``frame`` is a valid frame number, ``False``
+            otherwise
+
+        """
+        if frame.startswith("-"):
+            frame = frame[1:]
+
+        # isdigit() alone also accepts non-ASCII digits like "\u0663"
+        return frame.isascii() and frame.isdigit()
+
+    @staticmethod
+    def validate_time(time_str: str) -> bool:
+        """Check whether ``time_str`` represents a valid log time stamp
+
+        The following formats are accepted where ``#`` represents a digit 0-9
+        * ``#:##.##``
+        * ``##:##.##``
+        * ``#:##:##.##``
+        * ``##:##:##.##``
+
+        A prefix of ``-`` is also allowed.
+
+        >>> SectionItem.validate_time("-1:02:03.45")
+        True
+        >>> SectionItem.validate_time("30:00.03")
+        True
+        >>> SectionItem.validate_time("30:0.03")
+        False
+
+        TODO: Check whether the minute and hour values are valid (i.e. <60)
+
+        Args:
+            time_str: The potential time representation to validate
+
+        Returns: ``True`` if ``time_str`` is a valid time, ``False`` otherwise
+
+        """
+        return SectionItem._parse_time(time_str) is not None
+
+    @staticmethod
+    def _parse_time(time_str: str) -> Optional[timedelta]:
+        """Validate and convert a log time stamp in a single pass
+
+        Accepts the same formats as :py:meth:`SectionItem.validate_time`.
+        Parsing lines this way avoids splitting each time stamp twice, once to
+        validate it and again in :py:meth:`SectionItem.str_to_timedelta`.
+
+        >>> SectionItem._parse_time("1:02:03.45")
+        datetime.timedelta(seconds=3723, microseconds=450000)
+        >>> print(SectionItem._parse_time("30:0.03"))
+        None
+
+        Args:
+            time_str: The potential time representation to parse
+
+        Returns: The :py:class:timedelta represented by ``time_str``, or
+            ``None`` if ``time_str`` is not a valid time
+
+        """
+        neg = time_str.startswith("-")
+        if neg:
+            time_str = time_str[1:]
+
+        # Partitioning avoids building a list for each time stamp
+        # MM:SS.SS -> MM, SS.SS and HH:MM:SS.SS -> HH, MM, SS.SS
+        first, _, secs = time_str.partition(":")
+        mins, has_hours, rest = secs.partition(":")
+        if has_hours:
+            if len(mins) != 2:
+                return None
+            digits = first + mins
+            secs = rest
+        else:
+            digits = first
+        if not 1 <= len(first) <= 2 or len(secs) != 5 or secs[2] != ".":
+            return None
+        # isdigit() alone also accepts non-ASCII digits like "\u0663"
+        digits += secs[:2] + secs[3:]
+        if not (digits.isascii() and digits.isdigit()):
+            return None
+
+        total_mins = int(first) * 60 + int(mins) if has_hours else int(first)
+        total = (total_mins * 60 + int(secs[:2])) * 1000000 + \
+            int(secs[3:]) * 10000
+        return timedelta(microseconds=-total if neg else total)
+
+    @staticmethod
+    def validate_description(desc: str) -> bool:
+        """Check whether ``desc`` is a valid behavior description
+
+        To be valid, ``desc`` must be made exclusively of digits, letters,
+        commas, and spaces.
+
+        >>> SectionItem.validate_description("Some Description 3!")
+        False
+        >>> SectionItem.validate_description("Some Description, 3")
+        True
+        >>> SectionItem.validate_description("Some Description 3")
+        True
+        >>> SectionItem.validate_description("Some Description 3 here")
+        True
+        >>> SectionItem.validate_description("Some \\n Description 3!")
+        False
+
+        Args:
+            desc: The potential behavior description to check
+
+        Returns: ``True`` if ``desc`` is valid, ``False`` otherwise
+
+        """
+        return bool(desc) and DESCRIPTION_CHARS.issuperset(desc)
+
+    @staticmethod
+    def split_line(line: str) -> List[str]:
+        """Split a RawLog file line in a section into its elements
+
+        Elements must be separated by at least two whitespace characters
+
+        >>> SectionItem.split_line("  hi  4  test   >?why    my4 j   ")
+        ['hi', '4', 'test', '>?why', 'my4 j']
+        >>> SectionItem.split_line("1   0:00.03     name")
+        ['1', '0:00.03', 'name']
+
+        Args:
+            line: Line to split
+
+        Returns: A list of the elements in the provided line
+
+        """
+        # Stripping first leaves empty elements only for blank lines
+        return [elem for elem in ELEM_SEP_RE.split(line.strip()) if elem]
+
+    @staticmethod
+    def str_to_timedelta(time_str: str) -> timedelta:
+        """Convert a string representation of a time into a :py:class:timedelta
+
+        >>> SectionItem.str_to_timedelta("30:00.03")
+        datetime.timedelta(seconds=1800, microseconds=30000)
+
+        Args:
+            time_str: String representation of the time or duration
+
+        Returns: :py:class:timedelta object that represents the same duration
+            or time as ``time_str`` does.
+
+        """
+        neg = time_str.startswith("-")
+        if neg:
+            time_str = time_str[1:]
+
+        # Work in integer microseconds to avoid float rounding and conversion
+        # HH:MM:SS.SS -> [HH, MM, SS.SS] and MM:SS.SS -> [MM, SS.SS]
+        *larger, secs_str = time_str.split(":")
+        whole_secs, _, frac_secs = secs_str.partition(".")
+        secs = 0
+        for unit in larger:
+            secs = (secs + int(unit)) * 60
+        if whole_secs:
+            secs += int(whole_secs)
+        total = secs * 1000000
+        if frac_secs:
+            total += int(frac_secs[:6].ljust(6, "0"))
+        return timedelta(microseconds=-total if neg else total)
+
+
+class BehaviorFull(SectionItem):
+    """Store an interpreted representation of a behavior from the full section
+
+    Attributes:
+        frame: A positive integer representing the frame number on which the
+            behavior was scored.
+        time: A :py:class:timedelta object that represents the time elapsed
+            from the start of the clip to the behavior being scored. This is a
+            representation of the time listed in the log line.
+        description: The name of the behavior that appears as the second-to-last
+            element in the provided line
+        subject: Always the string ``either``
+        startend: Optional, either ``start`` or ``end``
+
+    Behaviors are ordered by frame, then time, description, and subject.
+    """
+
+    __slots__ = ("frame", "time", "description", "subject", "startend")
+
+    def _sort_key(self) -> tuple:
+        # pylint: disable=missing-docstring
+        return BEHAVIOR_SORT_KEY(self)
+
+    def __init__(self, behavior_line: str) -> None:
+        """Create a new :py:class:`BehaviorFull` object from the provided line.
+
+        >>> behav = BehaviorFull(" 1769  0:58.97  Flee from male  either ")
+        >>> behav.frame
+        1769
+        >>> behav.time
+        datetime.timedelta(seconds=58, microseconds=970000)
+        >>> behav.description
+        'Flee from male'
+        >>> behav.subject
+        'either'
+        >>> print(behav.startend)
+        None
+
+        Args:
+            behavior_line: A line from the ``FULL LOG`` section of a log file
+        Returns:
+            None
+        Raises:
+            TypeError: When the provided line does not conform to the
+                expected format. Notably, all the elements of the line must be
+                separated from each other by at least 2 spaces.
+        """
+        line = SectionItem.split_line(behavior_line)
+        line_error = "The line '" + behavior_line + "' is not a valid line " \
+                                                    "from the FULL LOG section"
+        if len(line) > 5:
+            err = "{} (num elements: {} > 5)".format(line_error, len(line))
+            raise TypeError(err)
+        elif len(line) < 4:
+            err = "{} (num elements: {} < 4)".format(line_error, len(line))
+            raise TypeError(err)
+        elif not SectionItem.validate_frame(line[0]):
+            err = "{} ('{}' is not a valid frame number)".format(line_error,
+                                                                 line[0])
+            raise TypeError(err)
+
+        time = self._parse_time(line[1])
+        if time is None:
+            err = "{} ('{}' is not a valid time)".format(line_error, line[1])
+            raise TypeError(err)
+        if not SectionItem.validate_description(line[2]):
+            err = "{} ('{}' is not a valid behavior)".format(line_error,
+                                                             line[2])
+            raise TypeError(err)
+        elif not BehaviorFull.validate_subject(line[3]):
+            err = "{} ('{}' is not a valid subject)".format(line_error, line[3])
+            raise TypeError(err)
+
+        self.frame = int(line[0])
+        self.time = time
+        # Logs repeat a handful of descriptions many times, so share one copy
+        # of each. The subject was validated to be exactly "either".
+        self.description = sys.intern(line[2])
+        self.subject = "either"
+        self.startend = line[4] if len(line) == 5 else None
+
+    @staticmethod
+    def validate_subject(subject: str) -> bool:
+        """Check whether ``subject`` is a valid subject element
+
+        To be valid, ``subject`` must be exactly ``either``
+
+        >>> BehaviorFull.validate_subject("either")
+        True
+        >>> BehaviorFull.validate_subject(" either")
+        False
+
+        Args:
+            subject: Potential subject element of a log to check
+
+        Returns: ``True`` if ``subject`` is valid, ``False`` otherwise
+
+        """
+        return subject == "either"
+
+
+class Mark(SectionItem):
+    """Store a ``mark`` from the ``MARKS`` section
+
+    Attributes:
+        frame: An integer representing the frame number at which the
+            mark is placed
+        time: A :py:class:timedelta object that represents the time elapsed
+            from the start of the clip to the mark. This is a
+            representation of the time listed in the log line. Negative times
+            are supported and are represented as their absolute times prefixed
+            with a ``-``.
+        name: Name of the mark that describes its meaning
+
+    Marks are ordered by frame, then time, and then name.
+    """
+
+    __slots__ = ("frame", "time", "name")
+
+    def _sort_key(self) -> tuple:
+        # pylint: disable=missing-docstring
+        return MARK_SORT_KEY(self)
+
+    def __init__(self, frame: int, time: timedelta, name: str) -> None:
+        self.frame = frame
+        self.time = time
+        self.name = name
+
+    @classmethod
+    def from_line(cls, line: str) -> "Mark":
+        """Create a new :py:class:Mark from a provided line from the log file
+
+        >>> mark = Mark.from_line("54001    30:00.03    video end")
+        >>> mark.frame
+        54001
+        >>> mark.time
+        datetime.timedelta(seconds=1800, microseconds=30000)
+        >>> mark.name
+        'video end'
+
+        Args:
+            line: A line from the ``MARKS`` section of a log file
+        Returns:
+            None
+        Raises:
+            TypeError: When the provided line does not conform to the
+                expected format. Notably, all 3 elements of the line must be
+                separated from each other by at least 2 spaces.
+
+        """
+        elems = SectionItem.split_line(line)
+        line_error = "The line '{}' is not a valid line from the MARKS section"\
+            .format(line)
+        if len(elems) < 3:
+            err = "{} (num elements: {} < 3)".format(line_error, len(elems))
+            raise TypeError(err)
+        elif len(elems) > 3:
+            err = "{} (num elements: {} > 3)".format(line_error, len(elems))
+            raise TypeError(err)
+        elif not SectionItem.validate_frame(elems[0]):
+            err = "{} (frame '{}' is not valid)".format(line_error, elems[0])
+            raise TypeError(err)
+
+        time = cls._parse_time(elems[1])
+        if time is None:
+            err = "{} (time '{}' is not valid)".format(line_error, elems[1])
+            raise TypeError(err)
+        if not SectionItem.validate_description(elems[2]):
+            err = "{} (mark name '{}' is invalid)".format(line_error, elems[2])
+            raise TypeError(err)
+
+        frame = int(elems[0])
+        # Mark names like "video start" repeat across logs, so share one copy
+        name = sys.intern(elems[2])
+
+        return cls(frame, time, name)
+
+    @staticmethod
+    def time_to_str(time: timedelta) -> str:
+        """Converts a :py:class:`timedelta` object into a string
+
+        >>> Mark.time_to_str(timedelta(seconds=1800.07))
+        '30:00.07'
+        >>> Mark.time_to_str(timedelta(seconds=4.4557))
+        '0:04.45'
+        >>> Mark.time_to_str(timedelta(seconds=3600.5))
+        '1:00:00.50'
+        >>> Mark.time_to_str(timedelta(seconds=-1800.07))
+        '-30:00.07'
+
+        Args:
+            time: The time to turn into a string.
+
+        Returns:
+            A string representation of the time, with 2 decimal-places of second
+            precision. The result is truncated if necessary.
+
+        Raises:
+            ValueError: Raised if time is greater than 1 day.
+        """
+        if abs(time) >= timedelta(days=1):
+            raise ValueError("The duration '{}' is too long (must be < 1 day)"
+                             .format(str(time)))
+
+        # Work in integer centiseconds, truncating any finer precision
+        centisecs = abs(time) // timedelta(microseconds=10000)
+        secs, centisecs = divmod(centisecs, 100)
+        mins, secs = divmod(secs, 60)
+        hours, mins = divmod(mins, 60)
+        if hours:
+            time_str = f"{hours}:{mins:02}:{secs:02}.{centisecs:02}"
+        else:
+            time_str = f"{mins}:{secs:02}.{centisecs:02}"
+
+        # Add negative sign for negative times
+        if time.total_seconds() < 0:
+            time_str = "-" + time_str
+
+        return time_str
+
+    def to_line(self, other_line: str) -> str:
+        """Converts a :py:class:Mark object into a log line in the MARKS section
+
+        ``other_line`` is used as a template. It should come from the log file
+        the returned line will be inserted into. Only loose error checking is
+        performed, and invalid lines may produce undefined output. Similarly,
+        if the constructed line cannot fit into the format prescribed by
+        ``other_line``, the output is undefined.
+
+        >>> mark = Mark(734, timedelta(seconds=1800.07), "video end")
+        >>> mark.to_line("  1    0:00.03    video start")
+        '734   30:00.07    video end'
+
+        Args:
+            other_line: A line from the MARKS section into which the resulting
+                string could be inserted. This defines the format this method
+                will attempt to match.
+
+        Returns: A log line that could be inserted into the MARKS section of
+            the log from which ``other_line`` came.
+
+        Raises:
+            ValueError: Raised if ``other_line`` is invalid or the mark's time
+                is greater than 1 day
+        """
+        return Mark.line_formatter(other_line)(self)
+
+    @staticmethod
+    def line_formatter(other_line: str) -> Callable[["Mark"], str]:
+        """Make a function that converts marks into lines like ``other_line``
+
+        The format of ``other_line`` is only parsed once, so to convert many
+        marks for the same log, this is faster than repeatedly calling
+        :py:meth:`Mark.to_line`.
+
+        >>> formatter = Mark.line_formatter("  1    0:00.03    video start")
+        >>> formatter(Mark(734, timedelta(seconds=1800.07), "video end"))
+        '734   30:00.07    video end'
+
+        Args:
+            other_line: A line from the MARKS section that defines the format to
+                match, as for :py:meth:`Mark.to_line`
+
+        Returns: A function that takes a :py:class:`Mark` and returns it as a
+            line formatted like ``other_line``
+
+        Raises:
+            ValueError: Raised if ``other_line`` is invalid. The returned
+                function raises ValueError if a mark's time is greater than 1
+                day.
+        """
+        match = MARK_LINE_RE.match(other_line)
+        if match is None:
+            err = "other_line '{}' is not a valid line from the MARKS section".\
+                format(other_line)
+            raise ValueError(err)
+        # match.group(n) returns the string in other_line that was matched by
+        # the n-th parenthesized group in the regular expression. Note that
+        # `(?: ... )` does not count as a group in this context
+        frame_col_width = len(match.group(1))
+        time_col_width = len(match[2])
+        time_name_sep_width = len(match[3])
+
+        template = Mark._line_template(frame_col_width, time_col_width,
+                                       time_name_sep_width)
+
+        def format_mark(mark: "Mark") -> str:
+            return template.format(mark.frame, Mark.time_to_str(mark.time),
+                                   mark.name)
+
+        return format_mark
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _line_template(frame_col_width: int, time_col_width: int,
+                       time_name_sep_width: int) -> str:
+        """Get a format string for a mark line with the provided column widths
+
+        Logs share a few column layouts, so templates are cached by width.
+
+        >>> Mark._line_template(5, 10, 4)
+        '{0:>5}{1:>10}    {2}'
+
+        Args:
+            frame_col_width: Width of the right-justified frame column
+            time_col_width: Width of the right-justified time column, including
+                the spaces separating it from the frame column
+            time_name_sep_width: Number of spaces between the time and the name
+
+        Returns: A template to fill with the frame, time string, and name using
+            :py:meth:`str.format`
+
+        """
+        # Creates a template like "{0:>frame_col_width}{1:>time_col_width}  {2}"
+        # Both the frame and time columns are right-justified and of lengths
+        # fixed by the variables frame_col_width and time_col_width. 0, 1, and 2
+        # are indices that define the locations to fill each arg of .format(...)
+        return "{0:>" + str(frame_col_width) + "}{1:>" + \
+               str(time_col_width) + "}" + (" " * time_name_sep_width) + \
+               "{2}"
+
+    def to_line_tab(self) -> str:
+        """Converts a :py:class:Mark object into a log line in the MARKS section
+
+        The resulting line is delimited by 4 spaces.
+
+        >>> mark = Mark(734, timedelta(seconds=1800.07), "video end")
+        >>> mark.to_line_tab()
+        '734    30:00.07    video end'
+
+        Returns:
+            A log line that could be inserted into the MARKS section of
+            the log from which ``other_line`` came. Note that since the line
+            has a fixed delimiter, this line may not appear to match the columns
+            in the file. However, this delimitation
+            is assumed by some other programs
+            for ``scorevideo`` logs, including ``behaviorcode``.
+
+        Raises:
+            ValueError: Raised if ``other_line`` is invalid or the mark's time
+                is greater than 1 day
+        """
+        time_str = Mark.time_to_str(self.time)
+        delim = '    '
+        return f"{self.frame}{delim}{time_str}{delim}{self.name}"
@@ -20,11 +20,12 @@ WARNING: This script is NOT general. It is specific to one particular
 
 import os
 import re
+from functools import lru_cache
 from typing import List, Tuple, Optional
 from scorevideo_lib.parse_log import Log, RawLog
 from scorevideo_lib.add_marks import copy_mark, get_ending_mark, \
     get_ending_behav
-from scorevideo_lib.base_utils import equiv_partition
+from scorevideo_lib.base_utils import equiv_partition_by_key
 
 
 class ExpectedFile:
@@ -53,6 +54,7 @@ class ExpectedFile:
         else:
             self.absent = []
         self.regex = regex
+        self._pattern = re.compile(regex) if regex else None
 
     def match(self, to_test: str) -> bool:
         """Checks whether a file name matches this description.
@@ -86,7 +88,7 @@ class ExpectedFile:
         for s in self.absent:
             if s in to_test:
                 return False
-        if self.regex and re.fullmatch(self.regex, to_test) is None:
+        if self._pattern and self._pattern.fullmatch(to_test) is None:
             return False
         return True
 
@@ -98,6 +100,10 @@ class ExpectedFile:
         return repr(self)
 
 
+# Names of the log files to process, as checked by name_filter()
+NAME_FILTER_RE = re.compile(
+    r"log[0-9]{6}_[0-9A-Z]+[0-9]{6}_[0-9A-Z]+_Dyad_([0-9]+|(Morning)).*")
+
 # Specify regular expressions that identify logs required for every partition
 PART_REQUIRED = [ExpectedFile(["_Morning."], ["_LIGHTSON.txt"]),
                  ExpectedFile(["_1."], ["_LIGHTSON.txt"])]
@@ -149,9 +155,7 @@ def copy_lights_on(aggr_logs: List[Log], scored_log: RawLog,
     log_tuples = []
     for log in aggr_logs[:-1]:
         end_mark = get_ending_mark(log.marks)
-        s_time = end_mark.time
-        s_frame = end_mark.frame
-        log_tuples.append((log, s_time, s_frame))
+        log_tuples.append((log, end_mark.time, end_mark.frame))
     # For the last video, the next video starts at the first aggressive behavior
     # because only the pre-scoring videos should be in aggr_logs
     last_log = aggr_logs[-1]
@@ -166,6 +170,30 @@ def copy_lights_on(aggr_logs: List[Log], scored_log: RawLog,
     return copy_mark(log_tuples, 'LIGHTS ON', scored_log, 'LIGHTS ON')
 
 
+@lru_cache(maxsize=None)
+def _split_name(filename: str) -> Tuple[str, str]:
+    """Split a file name into its core and its last element
+
+    Results are cached, since the same names are examined many times when
+    partitioning and classifying logs.
+
+    >>> _split_name("tmp/log050118_OB5B030618_TA23_Dyad_1.avi_CS.txt")
+    ('log050118_OB5B030618_TA23_Dyad', '1')
+
+    Args:
+        filename: The filename to split
+
+    Returns: The :py:func:`get_name_core` and :py:func:`get_last_name_elem` of
+        ``filename``
+
+    """
+    # Discard any file extensions (e.g. .wmv_AA.txt)
+    no_extension = os.path.basename(filename).split('.', 1)[0]
+    # Split at the last `_` (e.g. before 1, 2, or Morning)
+    core, _, end = no_extension.rpartition('_')
+    return core, end
+
+
 def get_name_core(filename: str) -> str:
     """Get the core of a filename
 
@@ -185,11 +213,7 @@ def get_name_core(filename: str) -> str:
     Returns: The core of the filename
 
     """
-    # Discard any file extensions (e.g. .wmv_AA.txt)
-    no_extension: str = os.path.basename(filename).split('.', 1)[0]
-    # Discard everything after the last `_` (e.g. 1, 2, or Morning)
-    core = no_extension.split('_')[:-1]
-    return "_".join(core)
+    return _split_name(filename)[0]
 
 
 def get_last_name_elem(filename: str) -> str:
@@ -210,11 +234,7 @@ def get_last_name_elem(filename: str) -> str:
         same fish on the same day
 
     """
-    # Discard any file extensions (e.g. .wmv_AA.txt)
-    no_extension: str = os.path.basename(filename).split('.', 1)[0]
-    # Keep everything after the last `_` (e.g. 1, 2, or Morning)
-    end = no_extension.split('_')[-1]
-    return end
+    return _split_name(filename)[1]
 
 
 def same_fish_and_day(name1: str, name2: str) -> bool:
@@ -242,11 +262,26 @@ def same_fish_and_day(name1: str, name2: str) -> bool:
     Returns: Whether the names share a core
 
     """
-    _, name1 = os.path.split(name1)
-    _, name2 = os.path.split(name2)
-    name1 = normalize_name(name1)
-    name2 = normalize_name(name2)
-    return get_name_core(name1) == get_name_core(name2)
+    return fish_and_day_key(name1) == fish_and_day_key(name2)
+
+
+def fish_and_day_key(filename: str) -> str:
+    """Get a key that is shared by all files from the same fish on the same day
+
+    The key is the :py:func:`get_name_core` of the normalized
+    (:py:func:`normalize_name`) file name, ignoring any directories.
+
+    >>> fish_and_day_key("tmp/050118_OB5B030618_TA23_Dyad_Morning.avi_CS")
+    'log050118_OB5B030618_TA23_Dyad'
+
+    Args:
+        filename: The filename to get the key for
+
+    Returns: The key for ``filename``
+
+    """
+    _, filename = os.path.split(filename)
+    return get_name_core(normalize_name(filename))
 
 
 def is_scored(filename: str) -> bool:
@@ -345,9 +380,8 @@ def name_filter(filename: str) -> bool:
     Returns:
         Whether the file should be included for analysis
     """
-    form = r"\Alog[0-9]{6}_[0-9A-Z]+[0-9]{6}_[0-9A-Z]+_Dyad_([0-9]+|(Morning)).*\Z"
     filename = normalize_name(filename)
-    return re.fullmatch(form, filename) is not None
+    return NAME_FILTER_RE.fullmatch(filename) is not None
 
 
 def validate_partition(partition: List[str]) -> List[str]:
@@ -448,8 +482,9 @@ def get_partitions(path_to_log_dir: str):
 
     Files beginning with ``.`` are filtered out, as are any files for which
     :py:func:`name_filter` returns ``False``. Names are partitioned using
-    :py:func:`equiv_partition`, where equivalence is determined by
-    :py:func:`same_fish_and_day` returning ``True``. Each name includes
+    :py:func:`equiv_partition_by_key`, where names with the same
+    :py:func:`fish_and_day_key` (i.e. for which :py:func:`same_fish_and_day`
+    returns ``True``) are equivalent. Each name includes
     the provided path as a prefix. Partitions are validated using
     :py:func:`validate_partition`.
 
@@ -462,11 +497,12 @@ def get_partitions(path_to_log_dir: str):
     Raises:
         ValueError: If any of the partitions fail validation
     """
-    files = [x for x in os.listdir(path_to_log_dir) if x[0] != '.']
-    files = [os.path.join(path_to_log_dir, x) for x in files
-             if name_filter(x)]
+    with os.scandir(path_to_log_dir) as entries:
+        files = [entry.path for entry in entries
+                 if entry.name[0] != '.' and name_filter(entry.name)]
 
-    partitions: List[List[str]] = equiv_partition(files, same_fish_and_day)
+    partitions: List[List[str]] = equiv_partition_by_key(files,
+                                                         fish_and_day_key)
 
     probs = False
     for partition in partitions:
@@ -502,12 +538,12 @@ def batch_mark_lights_on(path_to_log_dir: str) -> None:
         None
     """
     partitions = get_partitions(path_to_log_dir)
+    aggr_behav_des = read_aggr_behav_list()
     for partition in partitions:
         scored, lightson = find_scored_lights(partition)
 
-        if lightson:
-            with open(lightson, 'r') as f:
-                lightson_log = Log.from_file(f)
+        # The lights-on log extends the aggression log with the same ending
+        lightson_elem = get_last_name_elem(lightson) if lightson else None
 
         log_names = [name for name in partition
                      if name not in (scored, lightson)]
@@ -517,17 +553,16 @@ def batch_mark_lights_on(path_to_log_dir: str) -> None:
         for name in log_names:
             with open(name, 'r') as f:
                 log = Log.from_file(f)
-                if lightson and get_last_name_elem(name) == \
-                        get_last_name_elem(lightson):
-                    log.extend(lightson_log)
-                logs.append(log)
+            if lightson and get_last_name_elem(name) == lightson_elem:
+                with open(lightson, 'r') as f:
+                    log.extend(Log.from_file(f))
+            logs.append(log)
         with open(scored, 'r') as f:
             scored_raw = RawLog.from_file(f)
-            final = copy_lights_on(logs, scored_raw, read_aggr_behav_list())
+            final = copy_lights_on(logs, scored_raw, aggr_behav_des)
         with open(scored, 'w') as f:
             lines = final.to_lines()
-            for line in lines:
-                f.write(line + "\n")
+            f.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
@@ -6,6 +6,7 @@
 """
 
 from datetime import timedelta
+import re
 import pytest
 from scorevideo_lib.add_marks import copy_mark_disjoint, get_ending_mark
 from scorevideo_lib.parse_log import Log, RawLog, Mark
@@ -41,6 +42,31 @@ def test_add_lights_on_mark_correct():
     assert "-" in expected.marks[-1]
 
 
+def test_add_lights_on_mark_compiled_pattern():
+    with open(TEST_RES + "/realisticLogs/lights_on.txt", "r") as file:
+        source = Log.from_file(file)
+    with open(TEST_RES + "/realisticLogs/all.txt", "r") as file:
+        destination = RawLog.from_file(file)
+
+    expected = copy_mark_disjoint([source], "Lights On", destination, "L")
+    actual = copy_mark_disjoint([source], re.compile("Lights On"),
+                                destination, "L")
+
+    assert expected.marks[-1] == actual.marks[-1]
+
+
+def test_add_lights_on_mark_unicode_flag():
+    with open(TEST_RES + "/realisticLogs/lights_on.txt", "r") as file:
+        source = Log.from_file(file)
+    with open(TEST_RES + "/realisticLogs/all.txt", "r") as file:
+        destination = RawLog.from_file(file)
+
+    expected = copy_mark_disjoint([source], "Lights On", destination, "L")
+    actual = copy_mark_disjoint([source], "(?u)Lights On", destination, "L")
+
+    assert expected.marks[-1] == actual.marks[-1]
+
+
 def test_add_lights_on_nondisjoint_correct():
     pass # TODO: Write this test for add_lights non-disjoint
 
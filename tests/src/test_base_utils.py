@@ -6,7 +6,7 @@
 """
 from hypothesis import given, example
 from hypothesis.strategies import text, lists
-from scorevideo_lib.base_utils import equiv_partition
+from scorevideo_lib.base_utils import equiv_partition, equiv_partition_by_key
 
 # pragma pylint: disable=missing-docstring
 
@@ -50,3 +50,12 @@ def test_equiv_partition_text(lst):
 
     # Check that equiv_partition doesn't modify the list
     assert orig == lst
+
+
+@given(lists(text()))
+@example(['', '0', '/', '0'])
+def test_equiv_partition_by_key_matches_equiv_partition(lst):
+    orig = lst.copy()
+    by_key = equiv_partition_by_key(lst, lambda x: x[:1])
+    assert by_key == equiv_partition(lst, str_equiv)
+    assert orig == lst
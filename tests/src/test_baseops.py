@@ -23,6 +23,16 @@ class BareClass(BaseOps):
         self.letter = "C"
 
 
+class SlotClass(BaseOps):
+
+    # pylint: disable=too-few-public-methods
+
+    __slots__ = ("num",)
+
+    def __init__(self, num):
+        self.num = num
+
+
 def test_repr():
     test = BareClass()
     test.add_attribute()
@@ -37,6 +47,15 @@ def test_str():
     assert repr(test) == str(test)
 
 
+def test_str_uses_overridden_repr():
+    class ReprClass(BareClass):
+
+        def __repr__(self):
+            return "custom"
+
+    assert str(ReprClass()) == "custom"
+
+
 def test_eq():
     bare1 = BareClass()
     bare2 = BareClass()
@@ -45,3 +64,14 @@ def test_eq():
     assert bare1 != bare2
     bare1.add_attribute()
     assert bare1 == bare2
+
+
+def test_eq_other_type():
+    assert BareClass() != BaseOps()
+    assert BareClass() != {'num': 5, 'lst': ['hi', 'A', '?']}
+
+
+def test_slots():
+    assert repr(SlotClass(5)) == "{'num': 5}"
+    assert SlotClass(5) == SlotClass(5)
+    assert SlotClass(5) != SlotClass(6)
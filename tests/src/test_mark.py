@@ -7,7 +7,9 @@
 
 from datetime import timedelta
 import pytest
-from scorevideo_lib.parse_log import Mark
+from hypothesis import given
+from hypothesis.strategies import integers
+from scorevideo_lib.parse_log import Mark, SectionItem
 
 # pragma pylint: disable=missing-docstring
 
@@ -164,6 +166,19 @@ def test_to_line_valid_long_frame_in_template():
     assert mark.to_line(temp) == "    17     0:04.05    weird mark"
 
 
+def test_line_formatter_reused():
+    start = "    1     0:00.03    video start"
+    end = "54001    30:00.03    video end"
+    formatter = Mark.line_formatter(end)
+    assert formatter(Mark.from_line(start)) == start
+    assert formatter(Mark.from_line(end)) == end
+
+
+def test_line_formatter_invalid_template():
+    with pytest.raises(ValueError):
+        Mark.line_formatter("    1 0:00.03    video start")
+
+
 def test_to_line_invalid_template_1_space_after_frame():
     with pytest.raises(ValueError):
         mark = Mark(1, timedelta(seconds=1), "mark")
@@ -255,3 +270,46 @@ def test_lt_equal():
     second = Mark.from_line("    1     0:00.03    A video starts")
 
     assert first >= second
+
+
+def test_comparisons_frame():
+    first = Mark.from_line("    1     0:00.03    video start")
+    second = Mark.from_line("    2     0:00.03    video start")
+
+    assert first < second
+    assert first <= second
+    assert second > first
+    assert second >= first
+    assert first != second
+
+
+def test_lt_other_type():
+    with pytest.raises(TypeError):
+        assert Mark(1, timedelta(0), "mark") < 1
+
+
+def test_lt_subclass():
+    class SubMark(Mark):
+        # pylint: disable=too-few-public-methods
+        pass
+
+    sub = SubMark(1, timedelta(0), "mark")
+    assert Mark(0, timedelta(0), "mark") < sub
+    assert sub > Mark(0, timedelta(0), "mark")
+    assert sub <= Mark(1, timedelta(0), "mark")
+    assert sub == Mark(1, timedelta(0), "mark")
+    assert Mark(1, timedelta(0), "mark") == sub
+    assert Mark(0, timedelta(0), "mark") != sub
+
+
+def test_section_item_abstract():
+    with pytest.raises(TypeError):
+        # pylint: disable=abstract-class-instantiated
+        SectionItem()
+
+
+@given(integers(min_value=-(24 * 60 * 60 * 100 - 1),
+                max_value=24 * 60 * 60 * 100 - 1))
+def test_time_str_round_trip(centisecs):
+    time = timedelta(milliseconds=centisecs * 10)
+    assert Mark.str_to_timedelta(Mark.time_to_str(time)) == time
@@ -5,6 +5,7 @@
 
 """
 
+import io
 from scorevideo_lib.parse_log import RawLog
 from scorevideo_lib.exceptions import FileFormatError
 from scorevideo_lib.base_utils import remove_trailing_newline
@@ -269,3 +270,44 @@ def test_get_section_missing_header():
             assert str(error) == str(exp)
             failed = True
     assert failed
+
+
+def test_get_section_sequential_calls():
+    """Test extracting consecutive sections from the same file object
+
+    Each call should leave the file positioned after its section, so the
+    sections match those found by :py:meth:`RawLog.from_file`.
+
+    Returns: None
+
+    """
+    with open(TEST_RES + "/realisticLogs/all.txt", 'r') as file:
+        text = file.read()
+    expected = RawLog.from_file(io.StringIO(text))
+
+    log_file = io.StringIO(text)
+    assert RawLog.get_section_header(log_file) == expected.header
+    assert RawLog.get_section_video_info(log_file) == expected.video_info
+    assert RawLog.get_section_commands(log_file) == expected.commands
+    assert RawLog.get_section_raw(log_file) == expected.raw
+    assert RawLog.get_section_full(log_file) == expected.full
+    assert RawLog.get_section_notes(log_file) == expected.notes
+    assert RawLog.get_section_marks(log_file) == expected.marks
+
+
+def test_from_file_form_feed_in_notes():
+    """Test that only newlines separate lines
+
+    A form feed in a note should stay part of the note's line.
+
+    Returns: None
+
+    """
+    with open(TEST_RES + "/realisticLogs/all.txt", 'r') as file:
+        text = file.read()
+    notes_start = text.index("NOTES\n") + len("NOTES\n")
+    notes_start = text.index("\n", notes_start) + 1
+    text = text[:notes_start] + "a\x0cnote\n" + text[notes_start:]
+
+    log = RawLog.from_file(io.StringIO(text))
+    assert log.notes[0] == "a\x0cnote"